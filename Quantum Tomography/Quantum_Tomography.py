@@ -11,6 +11,9 @@ class UnknownQuantumSystem:
 
         self.original_state = self.__make_state(self.thetas)
         self.copy_state = self.original_state.copy()
+        # Marginals of original_state stay valid across get_qubits(); rotations start a fresh cache
+        self._original_marginal_cache = {}
+        self._marginal_cache = self._original_marginal_cache
 
         self.active_copies = 0
         print(f"{self.available_copies} copies of a {self.number_of_qubits}-qubit system created")
@@ -40,6 +43,7 @@ class UnknownQuantumSystem:
             self.active_copies = number_of_copies
             self.available_copies -= number_of_copies
             self.copy_state = self.original_state.copy()
+            self._marginal_cache = self._original_marginal_cache
             print(f"Have {self.active_copies} qubits, {self.available_copies} copies remaining")
 
     def rotate_qubit(self, qubit_index, angle = None):
@@ -57,6 +61,7 @@ class UnknownQuantumSystem:
         # Build the full matrix as I ⊗ I ⊗ Ry ⊗ I ⊗ ...
         full_matrix = self._build_rotation_matrix(angle, qubit_index)
         self.copy_state = self._apply_matrix(full_matrix, self.copy_state)
+        self._marginal_cache = {}
 
     def _apply_matrix(self, matrix, vector):
         """Applies a 2^n x 2^n matrix to a vector"""
@@ -107,18 +112,67 @@ class UnknownQuantumSystem:
             print("No active systems. Use get_qubits() first.")
             return
         
-        probabilities = [abs(amplitude)**2 for amplitude in self.copy_state]
-        outcomes = list(range(2**self.number_of_qubits))
+        probabilities = self._marginal_probabilities(tuple(range(self.number_of_qubits)))
+        result = self._sample(probabilities)
+        print("Measurement results:", result)
+        return result
+    
+    def measure(self, qubit_indices = None):
+        """Simulates measurement of a subset of qubits and counts results over that subset only"""
+        if self.active_copies == 0:
+            print("No active systems. Use get_qubits() first.")
+            return
+
+        if qubit_indices is None:
+            qubit_indices = list(range(self.number_of_qubits))
+        if not isinstance(qubit_indices, (list, tuple)) or len(qubit_indices) == 0 \
+                or any(not isinstance(q, int) for q in qubit_indices) \
+                or len(set(qubit_indices)) != len(qubit_indices) \
+                or any(not (0 <= q < self.number_of_qubits) for q in qubit_indices):
+            print()
+            print(f"ERROR: Invalid qubit indices, expected distinct indices in range [0, {self.number_of_qubits})")
+            return
+
+        probabilities = self._marginal_probabilities(tuple(qubit_indices))
+        result = self._sample(probabilities)
+        print(f"Measurement results for qubits {list(qubit_indices)}:", result)
+        return result
+
+    def _sample(self, probabilities):
+        """Samples the active copies from a distribution and counts results, consuming the copies"""
+        outcomes = list(range(len(probabilities)))
         measured_outcomes = choices(outcomes, weights=probabilities, k=self.active_copies)
 
         result = {outcome: 0 for outcome in measured_outcomes}
         for outcome in measured_outcomes:
             result[outcome] += 1
 
-        print("Measurement results:", result)
         self.active_copies = 0
         return result
-    
+
+    def _marginal_probabilities(self, qubit_indices):
+        """Marginal distribution over the given qubits, cached for the current state
+
+        The state is viewed as an n-axis array of shape (2, 2, ..., 2) with qubit 0
+        as the most significant axis; the axes not in qubit_indices are summed out.
+        The first index in qubit_indices is the most significant bit of an outcome.
+        """
+        if qubit_indices in self._marginal_cache:
+            return self._marginal_cache[qubit_indices]
+
+        n = self.number_of_qubits
+        shifts = [n - 1 - q for q in qubit_indices]
+        k = len(shifts)
+        marginal = [0.0] * (2**k)
+        for index, amplitude in enumerate(self.copy_state):
+            outcome = 0
+            for shift in shifts:
+                outcome = (outcome << 1) | ((index >> shift) & 1)
+            marginal[outcome] += abs(amplitude)**2
+
+        self._marginal_cache[qubit_indices] = marginal
+        return marginal
+
     def compare_guess(self, guesses):
         if not isinstance(guesses, list) or len(guesses) != self.number_of_qubits:
             print("ERROR: You must provide a list of", self.number_of_qubits, "angles in radian")